@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from aiohttp import (
     ClientConnectorError,
@@ -13,101 +12,75 @@ from aiohttp import (
     WSMessageTypeError,
 )
 from mozart_api.exceptions import ApiException
+from mozart_api.models import PairedRemote
 from mozart_api.mozart_client import MozartClient
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_MODEL, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.device_registry as dr
 from homeassistant.util.ssl import get_default_context
 
 from .const import DOMAIN, MANUFACTURER, BangOlufsenModel
 from .halo import Halo
-from .util import get_remotes, is_halo, is_mozart
+from .util import get_remotes, is_halo
 from .websocket import HaloWebsocket, MozartWebsocket
 
-MOZART_PLATFORMS = [
+MOZART_PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BINARY_SENSOR,
     Platform.EVENT,
     Platform.MEDIA_PLAYER,
     Platform.SELECT,
     Platform.SENSOR,
     Platform.TEXT,
-]
+)
 
-HALO_PLATFORMS = [
+HALO_PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.EVENT,
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
-]
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class MozartData:
-    """Dataclass for Mozart API client, WebSocket listener and WebSocket initialization variables."""
+    """Dataclass for Mozart API client, WebSocket listener and paired remotes."""
 
     websocket: MozartWebsocket
     client: MozartClient
-    platforms_initialized: int = 0
+    remotes: list[PairedRemote]
 
 
-@dataclass
+@dataclass(slots=True)
 class HaloData:
-    """Dataclass for API client, WebSocket listener and WebSocket initialization variables."""
+    """Dataclass for Halo API client and WebSocket listener."""
 
     websocket: HaloWebsocket
     client: Halo
-    platforms_initialized: int = 0
 
 
 type MozartConfigEntry = ConfigEntry[MozartData]
 type HaloConfigEntry = ConfigEntry[HaloData]
 
 
-def set_platform_initialized(data: MozartData | HaloData) -> None:
-    """Increment platforms_initialized to indicate that a platform has been initialized."""
-    data.platforms_initialized += 1
-
-
-async def _start_websocket_listener(
-    config_entry: HaloConfigEntry | MozartConfigEntry,
-    platforms: list[Platform],
-) -> None:
-    """Start WebSocket listener when all platforms have been initialized."""
-
-    while True:
-        # Check if all platforms have been initialized and start WebSocket listener
-        if len(platforms) == config_entry.runtime_data.platforms_initialized:
-            break
-
-        await asyncio.sleep(0)
-
-    if is_mozart(config_entry):
-        if TYPE_CHECKING:
-            assert isinstance(config_entry.runtime_data, MozartData)
-        await config_entry.runtime_data.client.connect_notifications(
-            remote_control=True, reconnect=True
-        )
-    else:
-        if TYPE_CHECKING:
-            assert isinstance(config_entry.runtime_data, HaloData)
-        await config_entry.runtime_data.client.connect_events(reconnect=True)
-
-
 async def _handle_remote_devices(
-    hass: HomeAssistant, config_entry: ConfigEntry, client: MozartClient
-) -> None:
-    """Add or remove paired Beoremote One devices."""
+    device_registry: dr.DeviceRegistry,
+    config_entry: ConfigEntry,
+    client: MozartClient,
+) -> list[PairedRemote]:
+    """Add or remove paired Beoremote One devices and return the paired remotes."""
+    if TYPE_CHECKING:
+        assert config_entry.unique_id
+
     # Check for connected Beoremote One
     if remotes := await get_remotes(client):
         for remote in remotes:
             if TYPE_CHECKING:
                 assert remote.serial_number
-                assert config_entry.unique_id
 
             # Create Beoremote One device
-            device_registry = dr.async_get(hass)
             device_registry.async_get_or_create(
                 config_entry_id=config_entry.entry_id,
                 identifiers={(DOMAIN, remote.serial_number)},
@@ -122,18 +95,20 @@ async def _handle_remote_devices(
     # If the remote is no longer available, then delete the device.
     # The remote may appear as being available to the device after has been unpaired on the remote
     # As it has to be removed from the device on the app.
+    remote_serial_numbers = {remote.serial_number for remote in remotes}
 
-    device_registry = dr.async_get(hass)
     devices = device_registry.devices.get_devices_for_config_entry_id(
         config_entry.entry_id
     )
     for device in devices:
         if (
             device.model == BangOlufsenModel.BEOREMOTE_ONE
-            and device.serial_number not in [remote.serial_number for remote in remotes]
+            and device.serial_number not in remote_serial_numbers
         ):
             device_registry.async_remove_device(device.id)
 
+    return remotes
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up from a config entry."""
@@ -157,10 +132,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         return await _setup_halo(hass, config_entry)
 
     # Mozart based products
-    return await _setup_mozart(hass, config_entry)
+    return await _setup_mozart(hass, config_entry, device_registry)
 
 
-async def _setup_mozart(hass: HomeAssistant, config_entry: MozartConfigEntry) -> bool:
+async def _setup_mozart(
+    hass: HomeAssistant,
+    config_entry: MozartConfigEntry,
+    device_registry: dr.DeviceRegistry,
+) -> bool:
     """Set up a Mozart based product."""
     client = MozartClient(
         host=config_entry.data[CONF_HOST], ssl_context=get_default_context()
@@ -185,20 +164,16 @@ async def _setup_mozart(hass: HomeAssistant, config_entry: MozartConfigEntry) ->
     # Initialize coordinator
     websocket = MozartWebsocket(hass, config_entry, client)
 
-    # Add the coordinator and API client
-    config_entry.runtime_data = MozartData(websocket, client)
-
     # Handle paired Beoremote One devices
-    await _handle_remote_devices(hass, config_entry, client)
+    remotes = await _handle_remote_devices(device_registry, config_entry, client)
+
+    # Add the coordinator, API client and paired remotes for the platforms
+    config_entry.runtime_data = MozartData(websocket, client, remotes)
 
     await hass.config_entries.async_forward_entry_setups(config_entry, MOZART_PLATFORMS)
 
-    # Start WebSocket connection when all entities have been initialized
-    config_entry.async_create_background_task(
-        hass,
-        _start_websocket_listener(config_entry, MOZART_PLATFORMS),
-        f"{DOMAIN}-{config_entry.unique_id}-mozart-websocket_starter",
-    )
+    # All entities have been added when the platforms have been forwarded
+    await client.connect_notifications(remote_control=True, reconnect=True)
 
     return True
 
@@ -206,7 +181,9 @@ async def _setup_mozart(hass: HomeAssistant, config_entry: MozartConfigEntry) ->
 async def _setup_halo(hass: HomeAssistant, config_entry: HaloConfigEntry) -> bool:
     """Set up a Halo."""
 
-    client = Halo(host=config_entry.data[CONF_HOST])
+    client = Halo(
+        host=config_entry.data[CONF_HOST], session=async_get_clientsession(hass)
+    )
 
     # Check API and WebSocket connection
     try:
@@ -224,12 +201,8 @@ async def _setup_halo(hass: HomeAssistant, config_entry: HaloConfigEntry) -> boo
 
     await hass.config_entries.async_forward_entry_setups(config_entry, HALO_PLATFORMS)
 
-    # Start WebSocket connection when all entities have been initialized
-    config_entry.async_create_background_task(
-        hass,
-        _start_websocket_listener(config_entry, HALO_PLATFORMS),
-        f"{DOMAIN}-{config_entry.unique_id}-halo-websocket_starter",
-    )
+    # All entities have been added when the platforms have been forwarded
+    await client.connect_events(reconnect=True)
 
     config_entry.async_on_unload(config_entry.add_update_listener(async_update_options))
 
@@ -244,15 +217,15 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
+    data: MozartData | HaloData = config_entry.runtime_data
+
     # Close the API client and WebSocket notification listener
-    if is_halo(config_entry):
-        if TYPE_CHECKING:
-            assert isinstance(config_entry.runtime_data, HaloData)
-        await config_entry.runtime_data.client.disconnect_events()
+    if isinstance(data, HaloData):
+        await data.client.disconnect_events()
         platforms = HALO_PLATFORMS
     else:
-        config_entry.runtime_data.client.disconnect_notifications()
-        await config_entry.runtime_data.client.close_api_client()
+        data.client.disconnect_notifications()
+        await data.client.close_api_client()
         platforms = MOZART_PLATFORMS
 
     return await hass.config_entries.async_unload_platforms(config_entry, platforms)
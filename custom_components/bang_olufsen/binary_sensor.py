@@ -13,11 +13,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import HaloConfigEntry, MozartConfigEntry, set_platform_initialized
+from . import HaloConfigEntry, HaloData, MozartConfigEntry
 from .const import CONNECTION_STATUS, WebsocketNotification
 from .entity import HaloEntity, MozartEntity
 from .halo import PowerEvent, PowerEventState
-from .util import is_halo
 
 
 async def async_setup_entry(
@@ -28,15 +27,13 @@ async def async_setup_entry(
     """Set up Binary Sensor entities from config entry."""
     entities: list[BangOlufsenBinarySensor] = []
 
-    if is_halo(config_entry):
+    if isinstance(config_entry.runtime_data, HaloData):
         entities.extend(await _get_halo_entities(config_entry))
     else:
         entities.extend(await _get_mozart_entities(config_entry))
 
     async_add_entities(new_entities=entities)
 
-    set_platform_initialized(config_entry.runtime_data)
-
 
 class BangOlufsenBinarySensor(BinarySensorEntity):
     """Base Binary Sensor class."""
@@ -152,5 +149,5 @@ class HaloBinarySensorBatteryCharging(HaloBinarySensor):
 
     async def _update_battery_charging(self, data: PowerEvent) -> None:
         """Update battery charging."""
-        self._attr_is_on = data.state == PowerEventState.CHARGING
+        self._attr_is_on = data.state is PowerEventState.CHARGING
         self.async_write_ha_state()
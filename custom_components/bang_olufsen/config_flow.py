@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from ipaddress import AddressValueError, IPv4Address
 from typing import Any, TypedDict
+from uuid import uuid4
 
 from aiohttp.client_exceptions import ClientConnectorError
 from mozart_api.exceptions import ApiException
@@ -28,11 +29,11 @@ from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     EntitySelector,
     EntitySelectorConfig,
+    SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
 )
 from homeassistant.util.ssl import get_default_context
-from homeassistant.util.uuid import random_uuid_hex
 
 from .const import (
     ATTR_FRIENDLY_NAME,
@@ -69,15 +70,13 @@ from .halo import (
     Page,
     Text,
 )
-from .util import get_serial_number_from_jid
+from .util import get_serial_number_from_jid, is_halo
 
 
 def halo_uuid() -> str:
     """Get a properly formatted Halo UUID."""
-    # UUIDs from uuid1() are not unique when generated in Home Assistant (???)
-    # Use this function to generate and format UUIDs instead.
-    temp_uuid = random_uuid_hex()
-    return f"{temp_uuid[:8]}-{temp_uuid[8:12]}-{temp_uuid[12:16]}-{temp_uuid[16:20]}-{temp_uuid[20:32]}"
+    # Random UUIDs in the canonical 8-4-4-4-12 format expected by the Halo
+    return str(uuid4())
 
 
 class BangOlufsenEntryData(TypedDict, total=False):
@@ -94,13 +93,61 @@ class BangOlufsenEntryData(TypedDict, total=False):
     entity_map: dict[str, str]
 
 
-# Map exception types to strings
-_exception_map = {
-    ApiException: "api_exception",
-    ClientConnectorError: "client_connector_error",
-    TimeoutError: "timeout_error",
-    AddressValueError: "invalid_ip",
-}
+def _get_error_key(error: Exception) -> str:
+    """Map exceptions, including subclasses, to error strings."""
+    match error:
+        case ApiException():
+            return "api_exception"
+        case ClientConnectorError():
+            return "client_connector_error"
+        case TimeoutError():
+            return "timeout_error"
+        case AddressValueError():
+            return "invalid_ip"
+
+    # Only the exceptions above are caught by the config flow
+    raise error
+
+
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_MODEL, default=DEFAULT_MODEL): SelectSelector(
+            SelectSelectorConfig(options=MOZART_MODELS)
+        ),
+    }
+)
+
+# The Halo options flow schemas do not depend on the flow state
+# TO DO filter unsupported entities
+ADD_PAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PAGE_NAME): str,
+        vol.Required(CONF_ENTITIES): EntitySelector(
+            EntitySelectorConfig(multiple=True)
+        ),
+    }
+)
+
+CREATE_BUTTONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TITLE): vol.All(
+            str,
+            vol.Length(max=HALO_TITLE_LENGTH),
+        ),
+        vol.Optional(CONF_SUBTITLE, default=""): vol.All(
+            str,
+            vol.Length(max=HALO_TITLE_LENGTH),
+        ),
+        vol.Exclusive(CONF_ICON, "content", "Error"): SelectSelector(
+            SelectSelectorConfig(options=HALO_BUTTON_ICONS)
+        ),
+        vol.Exclusive(CONF_TEXT, "content", "Error"): vol.All(
+            str,
+            vol.Length(max=HALO_TEXT_LENGTH),
+        ),
+    },
+)
 
 
 class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -123,15 +170,6 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_HOST): str,
-                vol.Required(CONF_MODEL, default=DEFAULT_MODEL): SelectSelector(
-                    SelectSelectorConfig(options=MOZART_MODELS)
-                ),
-            }
-        )
-
         if user_input is not None:
             self._host = user_input[CONF_HOST]
             self._model = user_input[CONF_MODEL]
@@ -141,8 +179,8 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
             except AddressValueError as error:
                 return self.async_show_form(
                     step_id="user",
-                    data_schema=data_schema,
-                    errors={"base": _exception_map[type(error)]},
+                    data_schema=USER_SCHEMA,
+                    errors={"base": _get_error_key(error)},
                 )
 
             self._mozart_client = MozartClient(
@@ -162,8 +200,8 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                 ) as error:
                     return self.async_show_form(
                         step_id="user",
-                        data_schema=data_schema,
-                        errors={"base": _exception_map[type(error)]},
+                        data_schema=USER_SCHEMA,
+                        errors={"base": _get_error_key(error)},
                     )
 
             self._beolink_jid = beolink_self.jid
@@ -176,7 +214,7 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=USER_SCHEMA,
         )
 
     async def async_step_zeroconf(
@@ -197,15 +235,16 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
 
         # Handle Mozart based products
         if discovery_info.type == ZEROCONF_MOZART:
-            await self._zeroconf_mozart(discovery_info)
+            if (result := await self._zeroconf_mozart(discovery_info)) is not None:
+                return result
 
         # Handle Beoremote Halo
         elif discovery_info.type == ZEROCONF_HALO:
             self._zeroconf_halo(discovery_info)
             name_key = ATTR_NAME
 
-        await self.async_set_unique_id(self._serial_number)
-        self._abort_if_unique_id_configured(updates={CONF_HOST: self._host})
+            await self.async_set_unique_id(self._serial_number)
+            self._abort_if_unique_id_configured(updates={CONF_HOST: self._host})
 
         # Set the discovered device title
         self.context["title_placeholders"] = {
@@ -230,6 +269,18 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         if ATTR_FRIENDLY_NAME not in discovery_info.properties:
             return self.async_abort(reason="not_mozart_device")
 
+        self._serial_number = discovery_info.properties[ATTR_MOZART_SERIAL_NUMBER]
+
+        # Abort repeated discoveries and unchanged configured devices before probing the device
+        await self.async_set_unique_id(self._serial_number)
+
+        if (
+            entry := self.hass.config_entries.async_entry_for_domain_unique_id(
+                DOMAIN, self._serial_number
+            )
+        ) is not None and entry.data[CONF_HOST] == self._host:
+            return self.async_abort(reason="already_configured")
+
         # Check connection to ensure valid address is received
         self._mozart_client = MozartClient(
             self._host, ssl_context=get_default_context()
@@ -241,8 +292,11 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
             except (ClientConnectorError, TimeoutError):
                 return self.async_abort(reason="invalid_address")
 
-        self._model = discovery_info.hostname[:-16].replace("-", " ")
-        self._serial_number = discovery_info.properties[ATTR_MOZART_SERIAL_NUMBER]
+        # Only update the host of a configured device once the address has been validated
+        self._abort_if_unique_id_configured(updates={CONF_HOST: self._host})
+
+        # The hostname is the model followed by the serial number, e.g. Beosound-Balance-12345678.local.
+        self._model = discovery_info.hostname.rpartition("-")[0].replace("-", " ")
         self._beolink_jid = f"{discovery_info.properties[ATTR_TYPE_NUMBER]}.{discovery_info.properties[ATTR_ITEM_NUMBER]}.{self._serial_number}@products.bang-olufsen.com"
 
         return None
@@ -288,21 +342,28 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         config_entry: ConfigEntry,
     ) -> OptionsFlow:
         """Create the options flow."""
-        # This option should only be available for the Halo,
-        # but this is currently not supported by Home Assistant.
         return HaloOptionsFlowHandler()
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: ConfigEntry) -> bool:
+        """Return options flow support for this handler."""
+        # Only the Halo has options
+        return is_halo(config_entry)
+
 
 class HaloOptionsFlowHandler(OptionsFlow):
     """HaloOptionsFlowHandler."""
 
     def __init__(self) -> None:
         """Initialize options."""
-        self._configuration: BaseConfiguration = BaseConfiguration(Configuration([]))
+        self._configuration: BaseConfiguration
+        self._buttons: dict[str, Button] = {}
         self._entity_ids: list[str] = []
         self._entity_map: dict[str, str] = {}
         self._page: Page
         self._current_default: str = str(None)
+        self._current_default_id: str | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -321,13 +382,19 @@ class HaloOptionsFlowHandler(OptionsFlow):
                 self.config_entry.options[CONF_HALO]
             )
             self._entity_map = self.config_entry.options[CONF_ENTITY_MAP]
+        else:
+            # The pages are modified in place, so each flow needs its own configuration
+            self._configuration = BaseConfiguration(Configuration([]))
 
-        # Check for a current default button.
+        # Index buttons by id and check for a current default button.
         # There should only be a single default in the whole configuration
         for page in self._configuration.configuration.pages:
             for button in page.buttons:
+                self._buttons[button.id] = button
+
                 if button.default:
                     self._current_default = f"{page.title}-{button.title} ({button.id})"
+                    self._current_default_id = button.id
 
         return self.async_show_menu(
             step_id="init",
@@ -356,19 +423,9 @@ class HaloOptionsFlowHandler(OptionsFlow):
 
             return await self.async_step_create_buttons()
 
-        # TO DO filter unsupported entities
-        options_schema = vol.Schema(
-            {
-                vol.Required(CONF_PAGE_NAME): str,
-                vol.Required(CONF_ENTITIES): EntitySelector(
-                    EntitySelectorConfig(multiple=True)
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="add_page",
-            data_schema=options_schema,
+            data_schema=ADD_PAGE_SCHEMA,
         )
 
     async def async_step_create_buttons(
@@ -408,25 +465,7 @@ class HaloOptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="create_buttons",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_TITLE): vol.All(
-                        str,
-                        vol.Length(max=HALO_TITLE_LENGTH),
-                    ),
-                    vol.Optional(CONF_SUBTITLE, default=""): vol.All(
-                        str,
-                        vol.Length(max=HALO_TITLE_LENGTH),
-                    ),
-                    vol.Exclusive(CONF_ICON, "content", "Error"): SelectSelector(
-                        SelectSelectorConfig(options=HALO_BUTTON_ICONS)
-                    ),
-                    vol.Exclusive(CONF_TEXT, "content", "Error"): vol.All(
-                        str,
-                        vol.Length(max=HALO_TEXT_LENGTH),
-                    ),
-                },
-            ),
+            data_schema=CREATE_BUTTONS_SCHEMA,
             description_placeholders={
                 "entity": self._entity_ids[-1],
                 "page": self._page.title,
@@ -437,17 +476,22 @@ class HaloOptionsFlowHandler(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Delete selected pages."""
+        pages = self._configuration.configuration.pages
 
         if user_input is not None:
-            for page_name in user_input[CONF_PAGES]:
-                for page in self._configuration.configuration.pages.copy():
-                    if page.title == page_name:
-                        # Remove page from configuration
-                        self._configuration.configuration.pages.remove(page)
-
-                        # Remove used button ids from entity_map
-                        for button in page.buttons:
-                            self._entity_map.pop(button.id)
+            # Page titles are unique, so pages can be matched by title
+            selected_pages = set(user_input[CONF_PAGES])
+
+            # Remove used button ids from entity_map
+            for page in pages:
+                if page.title in selected_pages:
+                    for button in page.buttons:
+                        self._entity_map.pop(button.id, None)
+
+            # Remove pages from configuration
+            self._configuration.configuration.pages = [
+                page for page in pages if page.title not in selected_pages
+            ]
 
             return self.async_create_entry(
                 title="Updated configuration",
@@ -459,9 +503,9 @@ class HaloOptionsFlowHandler(OptionsFlow):
                     entity_map=self._entity_map,
                 ),
             )
-        pages = [page.title for page in self._configuration.configuration.pages]
+        page_titles = [page.title for page in pages]
 
-        if len(pages) == 0:
+        if len(page_titles) == 0:
             return self.async_abort(reason="no_pages")
 
         return self.async_show_form(
@@ -470,7 +514,7 @@ class HaloOptionsFlowHandler(OptionsFlow):
                 {
                     vol.Required(CONF_PAGES): SelectSelector(
                         SelectSelectorConfig(
-                            options=pages,
+                            options=page_titles,
                             multiple=True,
                         )
                     ),
@@ -494,23 +538,12 @@ class HaloOptionsFlowHandler(OptionsFlow):
     ) -> ConfigFlowResult:
         """Select a default button."""
         if user_input is not None:
-            # Update configuration with new default
-            new_default = user_input[CONF_DEFAULT_BUTTON]
-
-            # Find the pages and buttons in the configuration
-            for page_idx, page in enumerate(self._configuration.configuration.pages):
-                for button_idx, button in enumerate(page.buttons):
-                    # Add new default to configuration
-                    if button.id in new_default:
-                        self._configuration.configuration.pages[page_idx].buttons[
-                            button_idx
-                        ].default = True
-
-                    # Remove current default from configuration
-                    if button.id in self._current_default:
-                        self._configuration.configuration.pages[page_idx].buttons[
-                            button_idx
-                        ].default = False
+            # Remove current default from configuration
+            if self._current_default_id is not None:
+                self._buttons[self._current_default_id].default = False
+
+            # Add new default to configuration. The selected option is the button id
+            self._buttons[user_input[CONF_DEFAULT_BUTTON]].default = True
 
             return self.async_create_entry(
                 title="Updated configuration",
@@ -524,15 +557,15 @@ class HaloOptionsFlowHandler(OptionsFlow):
             )
 
         # Get all buttons and check for a current default button
-        buttons = []
-        for page in self._configuration.configuration.pages:
-            buttons.extend(
-                [
-                    f"{page.title}-{button.title} ({button.id})"
-                    for button in page.buttons
-                    if button.default is False
-                ]
+        buttons = [
+            SelectOptionDict(
+                value=button.id,
+                label=f"{page.title}-{button.title} ({button.id})",
             )
+            for page in self._configuration.configuration.pages
+            for button in page.buttons
+            if not button.default
+        ]
 
         # Abort if no buttons are available
         if len(buttons) == 0:
@@ -560,16 +593,11 @@ class HaloOptionsFlowHandler(OptionsFlow):
         """Remove the default attribute from a button."""
 
         # Abort if no buttons are available
-        if self._current_default == str(None):
+        if self._current_default_id is None:
             return self.async_abort(reason="no_default")
 
         # Remove current default from configuration
-        for page_idx, page in enumerate(self._configuration.configuration.pages):
-            for button_idx, button in enumerate(page.buttons):
-                if button.id in self._current_default:
-                    self._configuration.configuration.pages[page_idx].buttons[
-                        button_idx
-                    ].default = False
+        self._buttons[self._current_default_id].default = False
 
         return self.async_create_entry(
             title="Updated configuration",
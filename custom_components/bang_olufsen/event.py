@@ -20,7 +20,7 @@ from homeassistant.helpers.entity_platform import (
     async_get_current_platform,
 )
 
-from . import HaloConfigEntry, MozartConfigEntry, set_platform_initialized
+from . import HaloConfigEntry, HaloData, MozartConfigEntry
 from .const import (
     BEO_REMOTE_CONTROL_KEYS,
     BEO_REMOTE_KEY_EVENTS,
@@ -41,7 +41,6 @@ from .const import (
 )
 from .entity import HaloEntity, MozartEntity
 from .halo import BaseUpdate, Notification, SystemEvent
-from .util import get_remotes, is_halo
 
 
 async def async_setup_entry(
@@ -52,7 +51,7 @@ async def async_setup_entry(
     """Set up Sensor entities from config entry."""
     entities: list[BangOlufsenEvent] = []
 
-    if is_halo(config_entry):
+    if isinstance(config_entry.runtime_data, HaloData):
         # Register halo services
 
         platform = async_get_current_platform()
@@ -85,8 +84,6 @@ async def async_setup_entry(
 
     async_add_entities(new_entities=entities)
 
-    set_platform_initialized(config_entry.runtime_data)
-
 
 class BangOlufsenEvent(EventEntity):
     """Base Event class."""
@@ -131,7 +128,7 @@ async def _get_mozart_entities(
         entities.append(BangOlufsenEventProximity(config_entry))
 
     # Check for connected Beoremote One
-    if remotes := await get_remotes(config_entry.runtime_data.client):
+    if remotes := config_entry.runtime_data.remotes:
         for remote in remotes:
             # Add Light keys
             entities.extend(
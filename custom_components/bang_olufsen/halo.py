@@ -1,17 +1,15 @@
 """Halo client."""
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Awaitable, Callable
-import contextlib
 from dataclasses import dataclass, field
 from enum import StrEnum
-import json
+from functools import cache
 import logging
-from typing import Final, Literal, TypedDict, cast
-from uuid import uuid1
+from typing import Final, Literal, TypedDict
+from uuid import uuid4
 
-from aiohttp import ClientSession, ClientTimeout, WSMessageTypeError
+from aiohttp import ClientSession, WSMessageTypeError, WSMsgType
 from aiohttp.client_exceptions import (
     ClientConnectorError,
     ClientOSError,
@@ -19,9 +17,11 @@ from aiohttp.client_exceptions import (
 )
 from inflection import underscore
 from mashumaro import field_options
-from mashumaro.mixins.json import DataClassJSONMixin
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+import orjson
 
 WEBSOCKET_TIMEOUT = 5.0
+WEBSOCKET_QUEUE_SIZE = 256
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,12 @@ MIN_VALUE: Final = 0
 MAX_VALUE: Final = 100
 
 
+@cache
+def _event_type_name(event_type: str) -> str:
+    """Get the snake_case name of an event type. Event types are a small fixed set."""
+    return underscore(event_type)
+
+
 class Icons(StrEnum):
     """Available icons for buttons."""
 
@@ -104,15 +110,15 @@ class Icons(StrEnum):
     YOGA = "yoga"
 
 
-@dataclass
-class Icon(DataClassJSONMixin):
+@dataclass(slots=True)
+class Icon(DataClassORJSONMixin):
     """Icon."""
 
     icon: Icons
 
 
-@dataclass
-class Text(DataClassJSONMixin):
+@dataclass(slots=True)
+class Text(DataClassORJSONMixin):
     """Icon."""
 
     text: str
@@ -125,8 +131,8 @@ class ButtonState(StrEnum):
     INACTIVE = "inactive"
 
 
-@dataclass
-class Button(DataClassJSONMixin):
+@dataclass(slots=True)
+class Button(DataClassORJSONMixin):
     """Button."""
 
     title: str
@@ -136,36 +142,36 @@ class Button(DataClassJSONMixin):
     value: int = 0
     state: ButtonState = ButtonState.INACTIVE
     default: bool = False
-    id: str = str(uuid1())
+    id: str = field(default_factory=lambda: str(uuid4()))
 
     def __post_init__(self) -> None:
         """Ensure value is in a valid range."""
 
-        if self.value < MIN_VALUE or self.value > MAX_VALUE:
+        if not MIN_VALUE <= self.value <= MAX_VALUE:
             msg = f"Button value must be in the range: {MIN_VALUE}..{MAX_VALUE}"
             raise ValueError(msg)
 
 
-@dataclass
-class Page(DataClassJSONMixin):
+@dataclass(slots=True)
+class Page(DataClassORJSONMixin):
     """Page containing buttons."""
 
     title: str
     buttons: list[Button]
-    id: str = str(uuid1())
+    id: str = field(default_factory=lambda: str(uuid4()))
 
 
-@dataclass
-class Configuration(DataClassJSONMixin):
+@dataclass(slots=True)
+class Configuration(DataClassORJSONMixin):
     """Configuration of pages."""
 
     pages: list[Page]
     version: str = "1.0.1"
-    id: str = str(uuid1())
+    id: str = field(default_factory=lambda: str(uuid4()))
 
 
-@dataclass
-class BaseConfiguration(DataClassJSONMixin):
+@dataclass(slots=True)
+class BaseConfiguration(DataClassORJSONMixin):
     """Configuration of pages."""
 
     configuration: Configuration
@@ -178,8 +184,8 @@ class ButtonEventState(StrEnum):
     RELEASED = "released"
 
 
-@dataclass
-class UpdateButton(DataClassJSONMixin):
+@dataclass(slots=True)
+class UpdateButton(DataClassORJSONMixin):
     """UpdateButton."""
 
     id: str
@@ -188,8 +194,8 @@ class UpdateButton(DataClassJSONMixin):
     type: str = field(default="button", init=False)
 
 
-@dataclass
-class ButtonEvent(DataClassJSONMixin):
+@dataclass(slots=True)
+class ButtonEvent(DataClassORJSONMixin):
     """ButtonEvent."""
 
     id: str
@@ -208,8 +214,8 @@ class PowerEventState(StrEnum):
     DISCHARGING = "discharging"
 
 
-@dataclass
-class PowerEvent(DataClassJSONMixin):
+@dataclass(slots=True)
+class PowerEvent(DataClassORJSONMixin):
     """PowerEvent."""
 
     type: str
@@ -224,8 +230,8 @@ class StatusEventState(StrEnum):
     ERROR = "error"
 
 
-@dataclass
-class StatusEvent(DataClassJSONMixin):
+@dataclass(slots=True)
+class StatusEvent(DataClassORJSONMixin):
     """StatusEvent."""
 
     type: str
@@ -241,16 +247,16 @@ class SystemEventState(StrEnum):
     SLEEP = "sleep"
 
 
-@dataclass
-class SystemEvent(DataClassJSONMixin):
+@dataclass(slots=True)
+class SystemEvent(DataClassORJSONMixin):
     """SystemEvent."""
 
     type: str
     state: SystemEventState
 
 
-@dataclass
-class WheelEvent(DataClassJSONMixin):
+@dataclass(slots=True)
+class WheelEvent(DataClassORJSONMixin):
     """WheelEvent."""
 
     type: str
@@ -258,15 +264,20 @@ class WheelEvent(DataClassJSONMixin):
     counts: int
 
 
-@dataclass
-class BaseEvent(DataClassJSONMixin):
-    """Base Event class."""
-
-    event: WheelEvent | SystemEvent | StatusEvent | PowerEvent | ButtonEvent
+# Event classes by their type field
+EVENT_TYPES: Final[
+    dict[str, type[WheelEvent | SystemEvent | StatusEvent | PowerEvent | ButtonEvent]]
+] = {
+    "wheel": WheelEvent,
+    "system": SystemEvent,
+    "status": StatusEvent,
+    "power": PowerEvent,
+    "button": ButtonEvent,
+}
 
 
-@dataclass
-class DisplayPage(DataClassJSONMixin):
+@dataclass(slots=True)
+class DisplayPage(DataClassORJSONMixin):
     """DisplayPage."""
 
     page_id: str = field(metadata=field_options(alias="pageid"))
@@ -274,18 +285,18 @@ class DisplayPage(DataClassJSONMixin):
     type: str = field(default="displaypage", init=False)
 
 
-@dataclass
-class Notification(DataClassJSONMixin):
+@dataclass(slots=True)
+class Notification(DataClassORJSONMixin):
     """Notification."""
 
     title: str
     subtitle: str
     type: str = field(default="notification", init=False)
-    id: str = str(uuid1())
+    id: str = field(default_factory=lambda: str(uuid4()))
 
 
-@dataclass
-class BaseUpdate(DataClassJSONMixin):
+@dataclass(slots=True)
+class BaseUpdate(DataClassORJSONMixin):
     """Base Update Class."""
 
     update: UpdateButton | DisplayPage | Notification
@@ -305,7 +316,7 @@ WebSocketEventType = type[
 class Halo:
     """User friendly Mozart REST API and WebSocket client."""
 
-    def __init__(self, host: str) -> None:
+    def __init__(self, host: str, session: ClientSession | None = None) -> None:
         """Initialize Mozart client."""
         self.host = host
         self.websocket_connected = False
@@ -313,15 +324,45 @@ class Halo:
 
         self._websocket_listener_active = False
         self._websocket_task: asyncio.Task
-        self._websocket_queue: asyncio.Queue = asyncio.Queue()
-        self._on_connection_lost: Callable[[None], Awaitable[None] | None] | None = None
-        self._on_connection: Callable[[None], Awaitable[None] | None] | None = None
-
-        self._on_all_events: Callable | None = None
-        self._on_all_events_raw: Callable | None = None
-
-        self._event_callbacks: dict[str, Callable | None] = defaultdict()
-        self._event_callbacks.default_factory = lambda: None
+        self._websocket_queue: asyncio.Queue[BaseConfiguration | BaseUpdate] = (
+            asyncio.Queue(maxsize=WEBSOCKET_QUEUE_SIZE)
+        )
+        # Queued Button updates by Button id, only the latest one of a Button is sent
+        self._pending_button_updates: dict[str, BaseUpdate] = {}
+
+        # Callbacks are stored with whether they are coroutine functions
+        self._on_connection_lost: tuple[Callable, bool] | None = None
+        self._on_connection: tuple[Callable, bool] | None = None
+
+        self._on_all_events: tuple[Callable, bool] | None = None
+        self._on_all_events_raw: tuple[Callable, bool] | None = None
+
+        self._event_callbacks: dict[str, tuple[Callable, bool] | None] = {
+            "wheel": None,
+            "system": None,
+            "status": None,
+            "power": None,
+            "button": None,
+        }
+
+        # Use a shared ClientSession if supplied, otherwise create and close one internally
+        self._session = session
+        self._close_session = False
+
+    def _get_session(self) -> ClientSession:
+        """Get the shared ClientSession or create one owned by the client."""
+        if self._session is None or self._session.closed:
+            self._session = ClientSession()
+            self._close_session = True
+
+        return self._session
+
+    async def _close_owned_session(self) -> None:
+        """Close the ClientSession if it was created by the client."""
+        if self._close_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._close_session = False
 
     async def _check_websocket_connection(
         self,
@@ -330,16 +371,17 @@ class Halo:
         | ClientConnectorError
         | ClientOSError
         | ServerTimeoutError
+        | TimeoutError
         | WSMessageTypeError
     ):
         """Check if a connection can be made to the device's WebSocket event channel."""
         try:
-            async with (
-                ClientSession(
-                    timeout=ClientTimeout(connect=WEBSOCKET_TIMEOUT)
-                ) as session,
-                session.ws_connect(f"ws://{self.host}:8080/") as websocket,
-            ):
+            async with asyncio.timeout(WEBSOCKET_TIMEOUT):
+                websocket = await self._get_session().ws_connect(
+                    f"ws://{self.host}:8080/"
+                )
+
+            async with websocket:
                 if await websocket.receive():
                     return True
 
@@ -347,6 +389,7 @@ class Halo:
             ClientConnectorError,
             ClientOSError,
             ServerTimeoutError,
+            TimeoutError,
             WSMessageTypeError,
         ) as error:
             return error
@@ -359,6 +402,7 @@ class Halo:
             | ClientConnectorError
             | ClientOSError
             | ServerTimeoutError
+            | TimeoutError
             | WSMessageTypeError
         ] = await asyncio.gather(  # type: ignore[assignment]
             self._check_websocket_connection(), return_exceptions=True
@@ -392,32 +436,73 @@ class Halo:
         self._websocket_listener_active = False
         self._websocket_task.cancel()
 
+        await self._close_owned_session()
+
     async def _websocket_connection(self, host: str) -> None:
         """WebSocket listener."""
         while True:
             try:
-                async with (
-                    ClientSession(
-                        timeout=ClientTimeout(connect=WEBSOCKET_TIMEOUT)
-                    ) as session,
-                    session.ws_connect(
+                async with asyncio.timeout(WEBSOCKET_TIMEOUT):
+                    websocket = await self._get_session().ws_connect(
                         url=host, heartbeat=WEBSOCKET_TIMEOUT
-                    ) as websocket,
-                ):
+                    )
+
+                async with websocket:
                     self.websocket_connected = True
 
+                    # Button updates queued while disconnected are superseded by the configuration sent on connection
+                    self._drop_button_updates()
+
                     if self._on_connection:
                         await self._trigger_callback(self._on_connection)
 
-                    while self._websocket_listener_active:
-                        with contextlib.suppress(asyncio.TimeoutError):
-                            event = await websocket.receive_str(timeout=0.1)
-
-                            await self._on_message(event)
-
-                        with contextlib.suppress(asyncio.QueueEmpty):
-                            update = self._websocket_queue.get_nowait()
-                            await websocket.send_str(cast(str, update))
+                    # Wait for either an incoming event or a queued update
+                    receive_task = asyncio.create_task(websocket.receive())
+                    send_task = asyncio.create_task(self._websocket_queue.get())
+
+                    try:
+                        while self._websocket_listener_active:
+                            done, _ = await asyncio.wait(
+                                (receive_task, send_task),
+                                return_when=asyncio.FIRST_COMPLETED,
+                            )
+
+                            if receive_task in done:
+                                message = receive_task.result()
+
+                                if message.type is not WSMsgType.TEXT:
+                                    raise WSMessageTypeError(
+                                        f"Received message {message.type}:{message.data!r} is not WSMsgType.TEXT"
+                                    )
+
+                                await self._on_message(message.data)
+                                receive_task = asyncio.create_task(websocket.receive())
+
+                            if send_task in done:
+                                data = send_task.result()
+
+                                if isinstance(data, BaseUpdate) and isinstance(
+                                    data.update, UpdateButton
+                                ):
+                                    self._pending_button_updates.pop(
+                                        data.update.id, None
+                                    )
+
+                                await websocket.send_str(data.to_json())
+                                send_task = asyncio.create_task(
+                                    self._websocket_queue.get()
+                                )
+                    finally:
+                        receive_task.cancel()
+
+                        # Requeue an item that has been dequeued but not sent
+                        unsent = None
+                        if send_task.done() and not send_task.cancelled():
+                            unsent = send_task.result()
+                        else:
+                            send_task.cancel()
+
+                        self._drop_button_updates(unsent)
 
                     self.websocket_connected = False
                     await websocket.close()
@@ -428,6 +513,7 @@ class Halo:
                 ClientOSError,
                 TypeError,
                 ServerTimeoutError,
+                TimeoutError,
                 WSMessageTypeError,
             ) as error:
                 if self.websocket_connected:
@@ -444,22 +530,54 @@ class Halo:
 
                 await asyncio.sleep(WEBSOCKET_TIMEOUT)
 
+    def _drop_button_updates(
+        self, unsent: BaseConfiguration | BaseUpdate | None = None
+    ) -> None:
+        """Remove queued Button updates and keep other queued items in order."""
+        queued = [] if unsent is None else [unsent]
+
+        while not self._websocket_queue.empty():
+            queued.append(self._websocket_queue.get_nowait())
+
+        self._pending_button_updates.clear()
+
+        for data in queued:
+            if isinstance(data, BaseUpdate) and isinstance(data.update, UpdateButton):
+                continue
+
+            try:
+                self._websocket_queue.put_nowait(data)
+            except asyncio.QueueFull:
+                break
+
     async def send(self, data: BaseConfiguration | BaseUpdate) -> bool:
         """Send Configuration or Update. Return True if successful."""
 
+        # Replace the update of a Button that is still waiting to be sent
+        if isinstance(data, BaseUpdate) and isinstance(data.update, UpdateButton):
+            if pending_update := self._pending_button_updates.get(data.update.id):
+                pending_update.update = data.update
+                return True
+
         try:
-            self._websocket_queue.put_nowait(data.to_json())
-        except (asyncio.QueueFull, asyncio.QueueShutDown):  # type: ignore[attr-defined]
+            self._websocket_queue.put_nowait(data)
+        except asyncio.QueueFull:
             return False
         else:
+            if isinstance(data, BaseUpdate) and isinstance(data.update, UpdateButton):
+                self._pending_button_updates[data.update.id] = data
+
             return True
 
     async def _on_message(self, event: str) -> None:
         """Handle WebSocket events."""
         # Get the object type and deserialized object.
+        # Parse the JSON once and reuse the dict for the raw event callback
         try:
-            deserialized_data = BaseEvent.from_json(event).event
-        except (ValueError, AttributeError) as error:
+            event_dict = orjson.loads(event)
+            event_data = event_dict["event"]
+            deserialized_data = EVENT_TYPES[event_data["type"]].from_dict(event_data)
+        except (ValueError, AttributeError, LookupError, TypeError) as error:
             logger.error(
                 "%s unable to deserialize WebSocket event: (%s) with error: (%s : %s)",
                 self.host,
@@ -474,77 +592,84 @@ class Halo:
             await self._trigger_callback(
                 self._on_all_events,
                 deserialized_data,  # type: ignore[arg-type]
-                underscore(deserialized_data.type),
+                _event_type_name(deserialized_data.type),
             )
 
         if self._on_all_events_raw:
-            await self._trigger_callback(self._on_all_events_raw, json.loads(event))
+            await self._trigger_callback(self._on_all_events_raw, event_dict)
 
         # Handle specific events if defined
-        triggered_event = self._event_callbacks[deserialized_data.type]
+        triggered_event = self._event_callbacks.get(deserialized_data.type)
 
         if triggered_event:
             await self._trigger_callback(triggered_event, deserialized_data)  # type: ignore[arg-type]
 
     async def _trigger_callback(
         self,
-        callback: Callable,
+        callback: tuple[Callable, bool],
         *args: BaseWebSocketResponse | dict | str | WebSocketEventType,
     ) -> None:
         """Trigger async or sync callback correctly."""
-        if asyncio.iscoroutinefunction(callback):
-            await callback(*args)
+        function, is_coroutine = callback
+
+        if is_coroutine:
+            await function(*args)
         else:
-            callback(*args)
+            function(*args)
+
+    @staticmethod
+    def _prepare_callback(callback: Callable) -> tuple[Callable, bool]:
+        """Pair a callback with whether it is a coroutine function."""
+        return callback, asyncio.iscoroutinefunction(callback)
 
     def get_on_connection_lost(self, on_connection_lost: Callable) -> None:
         """Set callback for WebSocket connection lost."""
-        self._on_connection_lost = on_connection_lost
+        self._on_connection_lost = self._prepare_callback(on_connection_lost)
 
     def get_on_connection(self, on_connection: Callable) -> None:
         """Set callback for WebSocket connection."""
-        self._on_connection = on_connection
+        self._on_connection = self._prepare_callback(on_connection)
 
     def get_all_events(
         self,
         on_all_events: Callable[[WebSocketEventType, str], Awaitable[None] | None],
     ) -> None:
         """Set callback for all events."""
-        self._on_all_events = on_all_events
+        self._on_all_events = self._prepare_callback(on_all_events)
 
     def get_all_events_raw(
         self,
         on_all_events_raw: Callable[[BaseWebSocketResponse], Awaitable[None] | None],
     ) -> None:
         """Set callback for all events as dict."""
-        self._on_all_events_raw = on_all_events_raw
+        self._on_all_events_raw = self._prepare_callback(on_all_events_raw)
 
     def get_wheel_event(
         self, on_wheel_event: Callable[[WheelEvent], Awaitable[None] | None]
     ) -> None:
         """Set callback for WheelEvent."""
-        self._event_callbacks["wheel"] = on_wheel_event
+        self._event_callbacks["wheel"] = self._prepare_callback(on_wheel_event)
 
     def get_system_event(
         self, on_system_event: Callable[[SystemEvent], Awaitable[None] | None]
     ) -> None:
         """Set callback for SystemEvent."""
-        self._event_callbacks["system"] = on_system_event
+        self._event_callbacks["system"] = self._prepare_callback(on_system_event)
 
     def get_status_event(
         self, on_status_event: Callable[[StatusEvent], Awaitable[None] | None]
     ) -> None:
         """Set callback for StatusEvent."""
-        self._event_callbacks["status"] = on_status_event
+        self._event_callbacks["status"] = self._prepare_callback(on_status_event)
 
     def get_power_event(
         self, on_power_event: Callable[[PowerEvent], Awaitable[None] | None]
     ) -> None:
         """Set callback for PowerEvent."""
-        self._event_callbacks["power"] = on_power_event
+        self._event_callbacks["power"] = self._prepare_callback(on_power_event)
 
     def get_button_event(
         self, on_button_event: Callable[[ButtonEvent], Awaitable[None] | None]
     ) -> None:
         """Set callback for ButtonEvent."""
-        self._event_callbacks["button"] = on_button_event
+        self._event_callbacks["button"] = self._prepare_callback(on_button_event)
@@ -78,7 +78,7 @@ from homeassistant.helpers.entity_platform import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import MANUFACTURER, MozartConfigEntry, set_platform_initialized
+from . import MANUFACTURER, MozartConfigEntry
 from .const import (
     ACCEPTED_COMMANDS,
     ACCEPTED_COMMANDS_LISTS,
@@ -143,8 +143,6 @@ async def async_setup_entry(
 
     async_add_entities(new_entities=entities, update_before_add=True)
 
-    set_platform_initialized(config_entry.runtime_data)
-
     # Register services.
     platform = async_get_current_platform()
 
@@ -12,7 +12,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import MozartConfigEntry, set_platform_initialized
+from . import MozartConfigEntry
 from .const import CONNECTION_STATUS, WebsocketNotification
 from .entity import MozartEntity
 
@@ -37,8 +37,6 @@ async def async_setup_entry(
 
     async_add_entities(new_entities=entities)
 
-    set_platform_initialized(config_entry.runtime_data)
-
 
 class BangOlufsenSelect(MozartEntity, SelectEntity):
     """Select for Mozart settings."""
@@ -22,11 +22,10 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import HaloConfigEntry, MozartConfigEntry, set_platform_initialized
+from . import HaloConfigEntry, HaloData, MozartConfigEntry
 from .const import CONNECTION_STATUS, DOMAIN, WebsocketNotification
 from .entity import HaloEntity, MozartEntity
 from .halo import PowerEvent
-from .util import get_remotes, is_halo
 
 SCAN_INTERVAL = timedelta(minutes=15)
 
@@ -41,15 +40,13 @@ async def async_setup_entry(
     """Set up Sensor entities from config entry."""
     entities: list[MozartSensor | HaloSensor] = []
 
-    if is_halo(config_entry):
+    if isinstance(config_entry.runtime_data, HaloData):
         entities.extend(await _get_halo_entities(config_entry))
     else:
         entities.extend(await _get_mozart_entities(config_entry))
 
     async_add_entities(new_entities=entities)
 
-    set_platform_initialized(config_entry.runtime_data)
-
 
 # Mozart entities
 class MozartSensor(MozartEntity, SensorEntity):
@@ -82,7 +79,7 @@ async def _get_mozart_entities(
         )
 
     # Check for connected Beoremote One
-    if remotes := await get_remotes(config_entry.runtime_data.client):
+    if remotes := config_entry.runtime_data.remotes:
         entities.extend(
             [MozartSensorRemoteBatteryLevel(config_entry, remote) for remote in remotes]
         )
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import MozartConfigEntry, set_platform_initialized
+from . import MozartConfigEntry
 from .const import CONNECTION_STATUS, MODEL_SUPPORT_HOME_CONTROL, MODEL_SUPPORT_MAP
 from .entity import MozartEntity
 
@@ -29,8 +29,6 @@ async def async_setup_entry(
 
     async_add_entities(new_entities=entities)
 
-    set_platform_initialized(config_entry.runtime_data)
-
 
 class BangOlufsenText(TextEntity, MozartEntity):
     """Base Text class."""
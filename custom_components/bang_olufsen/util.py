@@ -10,7 +10,7 @@ from mozart_api.mozart_client import MozartClient
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_MODEL
 
-from .const import MOZART_MODELS, BangOlufsenModel
+from .const import BangOlufsenModel
 
 
 def get_serial_number_from_jid(jid: str) -> str:
@@ -26,14 +26,6 @@ def is_halo(config_entry: ConfigEntry) -> bool:
     return False
 
 
-def is_mozart(config_entry: ConfigEntry) -> bool:
-    """Return if device is Mozart based."""
-
-    if config_entry.data[CONF_MODEL] in MOZART_MODELS:
-        return True
-    return False
-
-
 async def get_remotes(client: MozartClient) -> list[PairedRemote]:
     """Get remote status easier."""
     # Get if a remote control is connected and the remote
@@ -25,7 +25,6 @@ from mozart_api.models import (
     WebsocketNotificationTag,
 )
 from mozart_api.mozart_client import BaseWebSocketResponse, MozartClient
-import numpy as np
 from voluptuous import Invalid
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
@@ -97,6 +96,23 @@ from .util import get_remotes
 _LOGGER = logging.getLogger(__name__)
 
 
+def _clamp(value: float, min_value: float, max_value: float) -> float:
+    """Limit a value to a range."""
+    return min(max(value, min_value), max_value)
+
+
+def _interpolate(
+    value: float, in_min: float, in_max: float, out_min: float, out_max: float
+) -> float:
+    """Linearly map a value from one range to another, limited to the output range."""
+    if value <= in_min:
+        return out_min
+    if value >= in_max:
+        return out_max
+
+    return out_min + (value - in_min) * (out_max - out_min) / (in_max - in_min)
+
+
 @dataclass
 class WheelCounter:
     """Store Task and counter for wheel event service calls."""
@@ -109,7 +125,9 @@ class HaloWebsocket(HaloBase):
     """WebSocket for Halo."""
 
     _configuration: BaseConfiguration | None = None
+    _buttons: dict[str, Button] = {}
     _entity_map: dict[str, str] = {}
+    _entity_button_ids: dict[str, list[str]] = {}
     _wheel_action_handlers: dict[str, WheelCounter] = {}
 
     def __init__(
@@ -142,7 +160,12 @@ class HaloWebsocket(HaloBase):
         if config_entry.options:
             self._entity_map = config_entry.options[CONF_ENTITY_MAP]
 
-            entity_ids = set(self._entity_map.values())
+            # Reverse the entity map as an entity can be used by multiple buttons
+            self._entity_button_ids = {}
+            for button_id, entity_id in self._entity_map.items():
+                self._entity_button_ids.setdefault(entity_id, []).append(button_id)
+
+            entity_ids = set(self._entity_button_ids)
             async_track_state_change_event(
                 self.hass,
                 entity_ids,
@@ -152,6 +175,12 @@ class HaloWebsocket(HaloBase):
             self._configuration = BaseConfiguration.from_dict(
                 self.entry.options[CONF_HALO]
             )
+            # Index the buttons by id as they are looked up on every entity update
+            self._buttons = {
+                button.id: button
+                for page in self._configuration.configuration.pages
+                for button in page.buttons
+            }
             # Create wheel counters
             self._wheel_action_handlers = {
                 entity_id: WheelCounter() for entity_id in entity_ids
@@ -198,30 +227,15 @@ class HaloWebsocket(HaloBase):
 
     def _get_button_from_id(self, button_id: str) -> Button | None:
         """Get Button from button_id."""
-        if self._configuration is not None:
-            for page in self._configuration.configuration.pages:
-                for button in page.buttons:
-                    if button.id == button_id:
-                        return button
-        return None
+        return self._buttons.get(button_id)
 
     def _update_configuration(
-        self, button_id: str, button_state: ButtonState, button_value: int
+        self, button: Button, button_state: ButtonState, button_value: int
     ) -> None:
         """Update Configuration with a button's current value."""
-        if TYPE_CHECKING:
-            assert self._configuration
-
-        for page_idx, page in enumerate(self._configuration.configuration.pages):
-            for button_idx, button in enumerate(page.buttons):
-                if button.id == button_id:
-                    self._configuration.configuration.pages[page_idx].buttons[
-                        button_idx
-                    ].state = button_state
-
-                    self._configuration.configuration.pages[page_idx].buttons[
-                        button_idx
-                    ].value = button_value
+        # The indexed Button is the same object as in the Configuration
+        button.state = button_state
+        button.value = button_value
 
         # TO DO: Evaluate when config_entry options should be updated
         # new_entry_data = dict(self._entry.options)
@@ -231,7 +245,7 @@ class HaloWebsocket(HaloBase):
 
     def _clamp_value(self, value: int) -> int:
         """Clamp a value to work with Halo value."""
-        return int(np.clip(value, MIN_VALUE, MAX_VALUE))
+        return int(_clamp(value, MIN_VALUE, MAX_VALUE))
 
     async def _handle_no_button_action(self, entity_state: State) -> None:
         """Handle entity with no associated button action."""
@@ -243,14 +257,8 @@ class HaloWebsocket(HaloBase):
 
     async def _update_entity_button_values(self, entity_id: str) -> None:
         """Send Halo Button configuration updates of current entity states."""
-        # Get the button ids
-        button_ids = []
-        for mapped_button_id, mapped_entity_id in self._entity_map.items():
-            if mapped_entity_id == entity_id:
-                button_ids.append(mapped_button_id)
-
         # Handle update for pages that the entity is present on
-        for button_id in button_ids:
+        for button_id in self._entity_button_ids.get(entity_id, []):
             await self._handle_entity_update(entity_id, button_id)
 
     async def _handle_entity_state_change(
@@ -260,8 +268,8 @@ class HaloWebsocket(HaloBase):
         """Handle state change of entities."""
         entity_id = event.data[CONF_ENTITY_ID]
 
-        if entity_id not in self._entity_map.values():
-            logging.error("Entity %s is not in entity map")
+        if entity_id not in self._entity_button_ids:
+            _LOGGER.error("Entity %s is not in entity map", entity_id)
             return
 
         await self._update_entity_button_values(entity_id)
@@ -301,7 +309,7 @@ class HaloWebsocket(HaloBase):
             return
 
         # Update configuration
-        self._update_configuration(button.id, button_state, button_value)
+        self._update_configuration(button, button_state, button_value)
 
         # Send update to Halo
         await self._client.send(
@@ -394,10 +402,12 @@ class HaloWebsocket(HaloBase):
                 and state.attributes[ATTR_MAX] != 100
             ):
                 converted_state = int(
-                    np.interp(
+                    _interpolate(
                         converted_state,
-                        [state.attributes[ATTR_MIN], state.attributes[ATTR_MAX]],
-                        [MIN_VALUE, MAX_VALUE],
+                        state.attributes[ATTR_MIN],
+                        state.attributes[ATTR_MAX],
+                        MIN_VALUE,
+                        MAX_VALUE,
                     )
                 )
             else:
@@ -473,7 +483,7 @@ class HaloWebsocket(HaloBase):
         # Clamp the value if possible
         if {"min", "max"}.issubset(entity_state.attributes):
             new_number = int(
-                np.clip(
+                _clamp(
                     new_number,
                     entity_state.attributes[ATTR_MIN],
                     entity_state.attributes[ATTR_MAX],
@@ -484,9 +494,10 @@ class HaloWebsocket(HaloBase):
             return
 
         # Wrap action call in a task as callbacks can't be async
-        asyncio.create_task(
-            self._handle_number_wheel_action_task(entity_state, new_number)
-        ).done()
+        self.hass.async_create_task(
+            self._handle_number_wheel_action_task(entity_state, new_number),
+            eager_start=True,
+        )
 
     async def _handle_number_wheel_action_task(
         self, entity_state: State, new_number: int
@@ -560,9 +571,10 @@ class HaloWebsocket(HaloBase):
             return
 
         # Wrap action call in a task as callbacks can't be async
-        asyncio.create_task(
-            self._handle_switch_wheel_action_task(entity_state, action)
-        ).done()
+        self.hass.async_create_task(
+            self._handle_switch_wheel_action_task(entity_state, action),
+            eager_start=True,
+        )
 
     async def _handle_switch_wheel_action_task(
         self, entity_state: State, action: str
@@ -606,11 +618,7 @@ class HaloWebsocket(HaloBase):
             )
             # Brightness does not go to 255?
             converted_state = int(
-                np.interp(
-                    brightness,
-                    [0, 254],
-                    [MIN_VALUE, MAX_VALUE],
-                )
+                _interpolate(brightness, 0, 254, MIN_VALUE, MAX_VALUE)
             )
         except ValueError:
             _LOGGER.exception("Error when handling light state %s", state)
@@ -643,7 +651,7 @@ class HaloWebsocket(HaloBase):
 
         # Ensure valid and not-useless action value
         brightness_step = int(
-            np.clip(
+            _clamp(
                 self._wheel_action_handlers[entity_state.entity_id].counter, -100, 100
             )
         )
@@ -651,9 +659,10 @@ class HaloWebsocket(HaloBase):
             return
 
         # Wrap action call in a task as callbacks can't be async
-        asyncio.create_task(
-            self._handle_light_wheel_action_task(entity_state, brightness_step)
-        ).done()
+        self.hass.async_create_task(
+            self._handle_light_wheel_action_task(entity_state, brightness_step),
+            eager_start=True,
+        )
 
     async def _handle_light_wheel_action_task(
         self, entity_state: State, brightness_step: int
@@ -697,7 +706,7 @@ class HaloWebsocket(HaloBase):
             await self._client.send(self._configuration)
 
             # Send entity states as updates
-            for entity_id in self._entity_map.values():
+            for entity_id in self._entity_button_ids:
                 await self._update_entity_button_values(entity_id)
         else:
             _LOGGER.debug(